@@ -0,0 +1,28 @@
+#!/bin/sh
+# Build deployable artifacts into dist/ and precompress them so the server can
+# answer with brotli_static/gzip_static instead of compressing per request.
+# application_main.py is the HTML entry point; it is emitted under the name
+# nginx actually serves (application_main.html) so the .br/.gz siblings are
+# found. CSS/JS are copied to content-hashed names and the HTML references are
+# rewritten to match, which is what makes the immutable year-long Cache-Control
+# rule in deploy/nginx.conf safe: changed assets get new URLs. dist/ mirrors
+# the server root in deploy/nginx.conf.
+set -e
+cd "$(dirname "$0")/.."
+
+rm -rf dist
+mkdir -p dist/static
+
+css_hash=$(sha256sum static/app.css | cut -c1-8)
+js_hash=$(sha256sum static/app.js | cut -c1-8)
+cp static/app.css "dist/static/app.$css_hash.css"
+cp static/app.js "dist/static/app.$js_hash.js"
+
+sed -e "s|static/app\.css|static/app.$css_hash.css|g" \
+    -e "s|static/app\.js|static/app.$js_hash.js|g" \
+    application_main.py > dist/application_main.html
+
+for f in dist/application_main.html "dist/static/app.$css_hash.css" "dist/static/app.$js_hash.js"; do
+    brotli -f -q 11 -o "$f.br" "$f"
+    gzip -kf -9 "$f"
+done
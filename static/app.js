@@ -0,0 +1,540 @@
+// Sample book data
+const sampleBooks = [
+    {id: 1, title: "The Great Gatsby", author: "F. Scott Fitzgerald", genre: "Fiction", rating: 4.5, price: 299},
+    {id: 2, title: "To Kill a Mockingbird", author: "Harper Lee", genre: "Fiction", rating: 4.8, price: 349},
+    {id: 3, title: "1984", author: "George Orwell", genre: "Science Fiction", rating: 4.7, price: 279},
+    {id: 4, title: "Pride and Prejudice", author: "Jane Austen", genre: "Romance", rating: 4.6, price: 259},
+    {id: 5, title: "The Hobbit", author: "J.R.R. Tolkien", genre: "Fantasy", rating: 4.9, price: 399},
+    {id: 6, title: "Harry Potter", author: "J.K. Rowling", genre: "Fantasy", rating: 4.8, price: 449},
+    {id: 7, title: "The Catcher in the Rye", author: "J.D. Salinger", genre: "Fiction", rating: 4.3, price: 289},
+    {id: 8, title: "Brave New World", author: "Aldous Huxley", genre: "Science Fiction", rating: 4.4, price: 309}
+];
+
+let currentUser = null;
+let cart = new Map();  // book id -> { book, quantity }
+let allBooks = [...sampleBooks];
+
+// Cart count/total maintained incrementally so updates cost O(1), not O(cart)
+let cartCountVal = 0;
+let cartTotalVal = 0;
+
+// Star strings for ratings 0-5, built once instead of repeat() per card render
+const STARS = Array.from({ length: 6 }, (_, i) => '★'.repeat(i) + '☆'.repeat(5 - i));
+
+// Catalog indexes and per-book derived state; rebuild whenever the catalog changes
+let searchIndex = [];
+let booksById = new Map();
+function rebuildCatalogIndexes() {
+    searchIndex = allBooks.map(book => (book.title + '\t' + book.author + '\t' + book.genre).toLowerCase());
+    booksById = new Map(allBooks.map(book => [book.id, book]));
+    // Bake each book's cover gradient so renders just reuse the string
+    allBooks.forEach(book => {
+        const [c1, c2] = getCoverColors(book);
+        book._grad = `linear-gradient(135deg, ${c1} 0%, ${c2} 100%)`;
+    });
+}
+rebuildCatalogIndexes();
+
+// DOM references used on hot paths, cached once in init()
+let els = null;
+
+function cacheElements() {
+    els = {
+        booksGrid: document.getElementById('booksGrid'),
+        bookCardTpl: document.getElementById('bookCardTpl'),
+        cartItems: document.getElementById('cartItems'),
+        cartRowTpl: document.getElementById('cartRowTpl'),
+        cartTotal: document.getElementById('cartTotal'),
+        cartCount: document.getElementById('cartCount'),
+        cartSidebar: document.getElementById('cartSidebar'),
+        searchInput: document.getElementById('searchInput'),
+        authBtn: document.getElementById('authBtn'),
+        toast: document.getElementById('toast')
+    };
+}
+
+// Non-blocking notification in place of alert() on hot paths
+let toastTimer = null;
+function showToast(message) {
+    els.toast.textContent = message;
+    els.toast.hidden = false;
+    clearTimeout(toastTimer);
+    toastTimer = setTimeout(() => { els.toast.hidden = true; }, 1500);
+}
+
+// Initialize app
+function init() {
+    cacheElements();
+
+    // One delegated handler for every add-to-cart button in the grid
+    els.booksGrid.addEventListener('click', (e) => {
+        const btn = e.target.closest('.add-to-cart-btn');
+        if (btn) addToCart(Number(btn.dataset.id));
+    });
+
+    const savedUser = localStorage.getItem('currentUser');
+    if (savedUser) {
+        currentUser = JSON.parse(savedUser);
+        showLoggedInView();
+    } else {
+        showGuestView();
+    }
+    loadCart();
+}
+
+// Show guest view
+function showGuestView() {
+    document.body.dataset.state = 'guest';
+    els.authBtn.textContent = '👤 Sign In';
+    els.authBtn.onclick = showLogin;
+    els.searchInput.placeholder = 'Sign in to search books...';
+}
+
+// Show logged in view
+function showLoggedInView() {
+    document.body.dataset.state = 'user';
+    els.authBtn.textContent = '👤 ' + currentUser.username;
+    els.authBtn.onclick = logout;
+    els.searchInput.placeholder = 'Search books, authors, genres...';
+    displayBooks(allBooks);
+}
+
+// Display books
+function displayBooks(books) {
+    const grid = els.booksGrid;
+    const template = els.bookCardTpl;
+    const fragment = document.createDocumentFragment();
+
+    books.forEach(book => {
+        const card = template.content.cloneNode(true).firstElementChild;
+        const cover = card.querySelector('.book-cover');
+        cover.style.background = book._grad;
+        if (book.coverUrl) {
+            const img = cover.querySelector('.book-cover-img');
+            img.src = book.coverUrl;
+            img.hidden = false;
+        }
+        cover.querySelector('strong').textContent = book.title;
+        card.querySelector('.book-title').textContent = book.title;
+        card.querySelector('.book-author').textContent = `by ${book.author}`;
+        card.querySelector('.book-rating').textContent = `${STARS[Math.floor(book.rating)]} ${book.rating}`;
+        card.querySelector('.book-price').textContent = `₹${book.price}`;
+        card.querySelector('.add-to-cart-btn').dataset.id = book.id;
+        fragment.appendChild(card);
+    });
+
+    grid.replaceChildren(fragment);
+}
+
+// Deterministic colors so each book keeps the same cover between renders
+function getCoverColors(book) {
+    const colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a'];
+    return [colors[book.id % colors.length], colors[(book.id * 7 + 3) % colors.length]];
+}
+
+// Search books
+function searchBooks() {
+    if (!currentUser) {
+        showToast('Please sign in to search books');
+        return;
+    }
+
+    const query = els.searchInput.value.toLowerCase();
+    if (!query) return;
+
+    const filtered = [];
+    for (let i = 0; i < searchIndex.length; i++) {
+        if (searchIndex[i].indexOf(query) !== -1) filtered.push(allBooks[i]);
+    }
+
+    displayBooks(filtered);
+    if (filtered.length === 0) {
+        showToast(`No books found matching '${query}'`);
+    }
+}
+
+// Live search: debounce keystrokes and narrow the previous result set when the
+// new query extends the old one, so typing a query costs O(N) overall
+let searchTimer = null;
+let lastQuery = '';
+let lastMatches = null;
+
+function runLiveSearch() {
+    const query = els.searchInput.value.toLowerCase().trim();
+
+    if (!query) {
+        lastQuery = '';
+        lastMatches = null;
+        requestAnimationFrame(() => displayBooks(allBooks));
+        return;
+    }
+
+    const narrowing = lastMatches && lastQuery && query.startsWith(lastQuery);
+    const matches = [];
+    if (narrowing) {
+        for (const i of lastMatches) {
+            if (searchIndex[i].indexOf(query) !== -1) matches.push(i);
+        }
+    } else {
+        for (let i = 0; i < searchIndex.length; i++) {
+            if (searchIndex[i].indexOf(query) !== -1) matches.push(i);
+        }
+    }
+
+    lastQuery = query;
+    lastMatches = matches;
+    requestAnimationFrame(() => displayBooks(matches.map(i => allBooks[i])));
+}
+
+// Add to cart
+function addToCart(bookId) {
+    const book = booksById.get(bookId);
+    if (!book) return;
+
+    const existingItem = cart.get(bookId);
+    if (existingItem) {
+        existingItem.quantity++;
+    } else {
+        cart.set(bookId, { book, quantity: 1 });
+    }
+    cartCountVal++;
+    cartTotalVal += book.price;
+
+    saveCart();
+    updateCartUI();
+    showToast(`'${book.title}' added to cart!`);
+}
+
+// Mounted cart rows keyed by book id, so updates touch only what changed
+const cartRowMap = new Map();
+
+// Sidebar DOM is stale whenever the cart changed while it was closed
+let cartDirty = true;
+
+// Runs on every cart mutation; touches a single text node
+function updateCartBadge() {
+    const count = String(cartCountVal);
+    if (els.cartCount.textContent !== count) els.cartCount.textContent = count;
+}
+
+// Diffs the sidebar rows; only called when the sidebar is (becoming) visible
+function renderCartSidebar() {
+    const cartItems = els.cartItems;
+    const rowTemplate = els.cartRowTpl;
+    const seen = new Set();
+    cart.forEach(item => {
+        const itemTotal = item.book.price * item.quantity;
+        seen.add(item.book.id);
+
+        let row = cartRowMap.get(item.book.id);
+        if (!row) {
+            row = rowTemplate.content.cloneNode(true).firstElementChild;
+            row.querySelector('.ci-title').textContent = item.book.title;
+            row.querySelector('.ci-author').textContent = item.book.author;
+            cartRowMap.set(item.book.id, row);
+            cartItems.appendChild(row);
+        }
+        const line = `Quantity: ${item.quantity} × ₹${item.book.price} = ₹${itemTotal}`;
+        const lineEl = row.querySelector('.ci-line');
+        if (lineEl.textContent !== line) lineEl.textContent = line;
+    });
+
+    cartRowMap.forEach((row, id) => {
+        if (!seen.has(id)) {
+            row.remove();
+            cartRowMap.delete(id);
+        }
+    });
+
+    const totalText = cartTotalVal.toFixed(2);
+    if (els.cartTotal.textContent !== totalText) els.cartTotal.textContent = totalText;
+}
+
+// Update cart UI
+function updateCartUI() {
+    cartDirty = true;
+    updateCartBadge();
+    if (els.cartSidebar.classList.contains('active')) {
+        renderCartSidebar();
+        cartDirty = false;
+    }
+}
+
+// Toggle cart
+function toggleCart() {
+    const opening = !els.cartSidebar.classList.contains('active');
+    if (opening && cartDirty) {
+        renderCartSidebar();
+        cartDirty = false;
+    }
+    els.cartSidebar.classList.toggle('active');
+}
+
+// Checkout
+function checkout() {
+    if (!currentUser) {
+        alert('Please sign in to checkout');
+        return;
+    }
+    
+    if (cart.size === 0) {
+        alert('Your cart is empty');
+        return;
+    }
+
+    if (confirm(`Confirm order for ₹${cartTotalVal.toFixed(2)}?`)) {
+        alert('Order placed successfully! Thank you for your purchase!');
+        cart.clear();
+        cartCountVal = 0;
+        cartTotalVal = 0;
+        saveCart();
+        updateCartUI();
+        toggleCart();
+    }
+}
+
+// Show login modal
+function showLogin() {
+    closeModal();
+    document.getElementById('loginModal').classList.add('active');
+}
+
+// Show register modal
+function showRegister() {
+    closeModal();
+    document.getElementById('registerModal').classList.add('active');
+}
+
+// Close modal
+function closeModal() {
+    document.querySelectorAll('.modal').forEach(modal => {
+        modal.classList.remove('active');
+    });
+}
+
+// Salted hashing needs crypto.subtle, which browsers expose only in secure
+// contexts (HTTPS or localhost); over plain HTTP it is undefined
+function secureHashingAvailable() {
+    return typeof crypto !== 'undefined' && !!crypto.subtle;
+}
+
+// Random per-user salt as a hex string
+function makeSalt() {
+    const bytes = crypto.getRandomValues(new Uint8Array(16));
+    return Array.from(bytes).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// Hash a password with a per-user salt using the browser's crypto
+async function hashPassword(password, salt) {
+    const data = new TextEncoder().encode(salt + ':' + password);
+    const digest = await crypto.subtle.digest('SHA-256', data);
+    return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// Handle login
+async function handleLogin() {
+    const username = document.getElementById('loginUsername').value.trim();
+    const password = document.getElementById('loginPassword').value.trim();
+
+    if (!username || !password) {
+        alert('Please enter both username and password');
+        return;
+    }
+
+    const users = JSON.parse(localStorage.getItem('users') || '{}');
+    const user = users[username];
+    let valid = false;
+    if (user) {
+        if (user.hash) {
+            if (!secureHashingAvailable()) {
+                alert('This account uses hashed sign-in, which requires HTTPS (or localhost). Please use a secure connection.');
+                return;
+            }
+            valid = (await hashPassword(password, user.salt)) === user.hash;
+        } else if (user.password === password) {
+            valid = true;
+            if (secureHashingAvailable()) {
+                // Migrate pre-hashing accounts to salted hashes on successful login
+                user.salt = makeSalt();
+                user.hash = await hashPassword(password, user.salt);
+                delete user.password;
+                localStorage.setItem('users', JSON.stringify(users));
+            }
+        }
+    }
+
+    if (valid) {
+        currentUser = { username };
+        localStorage.setItem('currentUser', JSON.stringify(currentUser));
+        closeModal();
+        showLoggedInView();
+        showToast(`Welcome back, ${username}!`);
+    } else {
+        alert('Invalid username or password. Try: demo/demo123');
+    }
+}
+
+// Handle registration
+async function handleRegister() {
+    const username = document.getElementById('regUsername').value.trim();
+    const email = document.getElementById('regEmail').value.trim();
+    const password = document.getElementById('regPassword').value.trim();
+
+    if (!username || !email || !password) {
+        alert('Please fill in all fields');
+        return;
+    }
+
+    if (password.length < 6) {
+        alert('Password must be at least 6 characters');
+        return;
+    }
+
+    const users = JSON.parse(localStorage.getItem('users') || '{}');
+    if (users[username]) {
+        alert('Username already exists');
+        return;
+    }
+
+    if (secureHashingAvailable()) {
+        const salt = makeSalt();
+        users[username] = { salt, hash: await hashPassword(password, salt), email };
+    } else {
+        // Insecure context: keep the legacy plaintext record rather than break
+        // registration; it is upgraded on first login over HTTPS
+        users[username] = { password, email };
+    }
+    localStorage.setItem('users', JSON.stringify(users));
+    
+    alert('Account created successfully! Please sign in.');
+    closeModal();
+    showLogin();
+}
+
+// Logout
+function logout() {
+    if (confirm('Are you sure you want to logout?')) {
+        currentUser = null;
+        localStorage.removeItem('currentUser');
+        cart.clear();
+        cartCountVal = 0;
+        cartTotalVal = 0;
+        saveCart();
+        updateCartUI();
+        showGuestView();
+    }
+}
+
+// Show home
+function showHome() {
+    if (currentUser) {
+        displayBooks(allBooks);
+        els.searchInput.value = '';
+    }
+}
+
+// Show AI Insights
+function showAIInsights() {
+    if (!currentUser) {
+        showToast('Please sign in to view AI insights');
+        return;
+    }
+    alert('🧠 AI Insights Dashboard\n\nPersonalized recommendations based on your browsing history and preferences.\n\n📊 Features:\n• Content-based filtering\n• Collaborative recommendations\n• Trending books analysis\n• Price optimization\n\n(Full dashboard coming soon!)');
+}
+
+// Tiny promise wrapper around one IndexedDB object store, so cart writes
+// happen off the main thread instead of through synchronous localStorage
+let cartDbPromise = null;
+function cartDb() {
+    if (!cartDbPromise) {
+        cartDbPromise = new Promise((resolve, reject) => {
+            const req = indexedDB.open('bookstore', 1);
+            req.onupgradeneeded = () => req.result.createObjectStore('kv');
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        });
+    }
+    return cartDbPromise;
+}
+
+function idbSet(key, value) {
+    return cartDb().then(db => new Promise((resolve, reject) => {
+        const tx = db.transaction('kv', 'readwrite');
+        tx.objectStore('kv').put(value, key);
+        tx.oncomplete = resolve;
+        tx.onerror = () => reject(tx.error);
+    }));
+}
+
+function idbGet(key) {
+    return cartDb().then(db => new Promise((resolve, reject) => {
+        const req = db.transaction('kv').objectStore('kv').get(key);
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+    }));
+}
+
+function persistCart(items) {
+    if (window.indexedDB) {
+        idbSet('cart', items).catch(() => localStorage.setItem('cart', JSON.stringify(items)));
+    } else {
+        localStorage.setItem('cart', JSON.stringify(items));
+    }
+}
+
+// Save cart, coalescing bursts of mutations into one async write
+let saveScheduled = false;
+function saveCart() {
+    if (saveScheduled) return;
+    saveScheduled = true;
+    queueMicrotask(() => {
+        saveScheduled = false;
+        persistCart(Array.from(cart.values()));
+    });
+}
+
+// Load cart from IndexedDB, falling back to (and migrating from) localStorage
+async function loadCart() {
+    let items = null;
+    if (window.indexedDB) {
+        try {
+            items = await idbGet('cart');
+        } catch (e) {
+            // fall through to localStorage
+        }
+    }
+    if (!items) {
+        const saved = localStorage.getItem('cart');
+        if (saved) items = JSON.parse(saved);
+    }
+    if (items) {
+        cart = new Map(items.map(item => [item.book.id, item]));
+        cartCountVal = items.reduce((sum, item) => sum + item.quantity, 0);
+        cartTotalVal = items.reduce((sum, item) => sum + item.book.price * item.quantity, 0);
+        updateCartUI();
+    }
+}
+
+// Initialize on load
+init();
+
+// Search on Enter key
+els.searchInput.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter') searchBooks();
+});
+
+// Live search while typing, debounced so bursts of keystrokes filter once
+els.searchInput.addEventListener('input', () => {
+    if (!currentUser) return;
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(runLiveSearch, 120);
+});
+
+// Close modals on backdrop click or Escape — one delegated listener each
+document.addEventListener('click', (e) => {
+    if (e.target.classList.contains('modal')) closeModal();
+});
+
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape') closeModal();
+});